@@ -2,12 +2,119 @@
 
 from typing import Optional
 
-import matplotlib.pyplot as plt
 import numpy as np
-from skimage.color import rgb2gray, rgba2rgb
 
 from .utils import init_logger
 
+# Rec. 709 luminance coefficients (same as `skimage.color.rgb2gray`)
+_LUMA_COEFFS = np.array([0.2125, 0.7154, 0.0721], dtype=np.float32)
+# fixed-point Rec. 601 coefficients (sum to 256, same as cv2/numba paths)
+_LUMA_COEFFS_U16 = np.array([77, 150, 29], dtype=np.uint16)
+
+
+def _fused_gray(rgb_image: np.ndarray, xp=np) -> np.ndarray:
+    r"""Convert RGB(A) image to float32 grayscale in a single fused pass
+
+    Folds alpha compositing (against a white background, matching
+    `skimage.color.rgba2rgb` defaults) into the luminance dot-product so
+    no intermediate RGB float image is ever materialized. Result stays
+    float32 since downstream thresholding does not need float64 precision.
+
+    Parameters
+    ----------
+    rgb_image : numpy.ndarray, shape=(N, M, 3) or (N, M, 4)
+    xp : module, default=numpy
+        Array namespace to compute in (numpy, or cupy for GPU offload)
+
+    Returns
+    -------
+    gray_image : numpy.ndarray, shape=(N, M), dtype=float32
+        Grayscale image scaled to [0, 1]
+    """
+    scale = None
+    if np.issubdtype(rgb_image.dtype, np.integer):
+        scale = xp.float32(1 / np.iinfo(rgb_image.dtype).max)
+    rgb = rgb_image[..., :3].astype(xp.float32, copy=False)
+    if scale is not None:
+        rgb = rgb * scale
+    gray = xp.einsum("hwc,c->hw", rgb, xp.asarray(_LUMA_COEFFS))
+    if rgb_image.shape[-1] == 4:
+        alpha = rgb_image[..., 3].astype(xp.float32, copy=False)
+        if scale is not None:
+            alpha = alpha * scale
+        # composite against white (luminance = 1) without an RGB temporary
+        gray = gray * alpha + (xp.float32(1.0) - alpha)
+    return gray
+
+
+def _to_gray_u8(rgb_image: np.ndarray, device: str = "cpu") -> np.ndarray:
+    r"""Convert RGB(A) image to grayscale via the fastest available backend
+
+    For uint8 inputs, dispatch to OpenCV or Pillow when installed; both
+    run the conversion through SIMD intrinsics on packed uint8 data.
+    Fall back to the fused NumPy kernel otherwise. With `device="gpu"`
+    and cupy installed, the fused kernel runs on the GPU inside a
+    non-blocking stream so host-side decode of the next file overlaps.
+
+    Parameters
+    ----------
+    rgb_image : numpy.ndarray, shape=(N, M, 3) or (N, M, 4)
+    device : {"cpu", "gpu"}, default="cpu"
+        Ignored (CPU path) when cupy is unavailable
+
+    Returns
+    -------
+    gray_image : numpy.ndarray, shape=(N, M)
+        uint8 (0-255) for uint8 inputs, float32 in [0, 1] otherwise
+    """
+    if device == "gpu":
+        try:
+            import cupy as cp
+            with cp.cuda.Stream(non_blocking=True):
+                gray = _fused_gray(cp.asarray(rgb_image), xp=cp)
+                if rgb_image.dtype == np.uint8:
+                    gray = cp.rint(gray * 255).astype(cp.uint8)
+                return cp.asnumpy(gray)
+        except ImportError:
+            pass
+        except Exception:
+            # cupy is installed but has no usable CUDA device (or the
+            # allocation failed); degrade to the CPU backends below
+            pass
+    if rgb_image.shape[-1] == 4:
+        if rgb_image.dtype == np.uint8 and rgb_image[..., 3].min() == 255:
+            # fully opaque (the common case for exported PNGs): skip
+            # compositing entirely and hand the RGB channels to a backend
+            rgb_image = np.ascontiguousarray(rgb_image[..., :3])
+        else:
+            # cv2/Pillow drop alpha rather than compositing against the
+            # white background, so partially transparent images stay on
+            # the fused kernel for correctness
+            gray = _fused_gray(rgb_image)
+            if rgb_image.dtype == np.uint8:
+                gray = np.rint(gray * 255).astype(np.uint8)
+            return gray
+    if rgb_image.dtype == np.uint8:
+        try:
+            import cv2
+            return cv2.cvtColor(rgb_image, cv2.COLOR_RGB2GRAY)
+        except ImportError:
+            pass
+        try:
+            from PIL import Image
+            return np.asarray(Image.fromarray(rgb_image).convert("L"))
+        except ImportError:
+            pass
+        from ._kernels import rgb_to_gray_u8
+        gray = rgb_to_gray_u8(rgb_image)
+        if gray is not None:
+            return gray
+        # integer-domain fallback: one pass, no float conversion
+        # (uint16 accumulator cannot overflow since 256 * 255 < 2**16)
+        return (np.einsum("hwc,c->hw", rgb_image[..., :3].astype(np.uint16),
+                          _LUMA_COEFFS_U16) >> 8).astype(np.uint8)
+    return _fused_gray(rgb_image)
+
 
 class BaseImage():
     r"""Base class - read and convert grayscale image
@@ -19,12 +126,17 @@ class BaseImage():
     class_name : str, optional
         Class name for logger. If None, defaults to root
     verbose : bool, default=False
+    device : {"cpu", "gpu"}, default="cpu"
+        Run the grayscale conversion on the GPU via cupy when available
+        (silently falls back to CPU otherwise)
 
     Attributes
     ----------
     rgb_image : numpy.ndarray
-        RGB(A) image
+        RGB(A) image (kept as passed; alpha is composited during
+        grayscale conversion without materializing an RGB copy)
     gray_image : numpy.ndarray, shape=(N, M)
+        uint8 for uint8 inputs, float32 otherwise
     verbose : bool, default=False
     class_name : str
     logger : logging.Logger
@@ -34,29 +146,53 @@ class BaseImage():
         self,
         rgb_image: np.ndarray,
         class_name: Optional[str] = None,
-        verbose: bool = False
+        verbose: bool = False,
+        device: str = "cpu"
     ):
         self.verbose = verbose
         self.logger = init_logger(name=class_name)
-        self.rgb_image = rgb_image
-        self._orig_gray = False
+        # strided views (e.g. slices of batched tensors) force hidden
+        # copies in every downstream filter; normalize the layout once
+        self.rgb_image = np.ascontiguousarray(rgb_image)
         im_shape = self.rgb_image.shape
-        if len(im_shape) == 2:
-            self.gray_image: np.ndarray = self.rgb_image.copy()
-            self._orig_gray = True
-        elif len(im_shape) == 3 and im_shape[-1] == 4:
-            self.rgb_image = rgba2rgb(self.rgb_image)
-        elif len(im_shape) != 3:
+        if (len(im_shape) == 3
+                and np.issubdtype(self.rgb_image.dtype, np.floating)
+                and self.rgb_image.max() <= 1.0):
+            # [0, 1] float color input: pack to uint8 once so the SIMD
+            # uint8 backends engage instead of the float fallback
+            self.rgb_image = np.rint(self.rgb_image * 255).astype(np.uint8)
+        self._orig_gray = len(im_shape) == 2
+        if self._orig_gray:
+            # shared with rgb_image, not copied: converters and exposure
+            # correction all allocate their own outputs downstream
+            self.gray_image: np.ndarray = self.rgb_image
+        elif len(im_shape) == 3 and im_shape[-1] in (3, 4):
+            self.gray_image: np.ndarray = _to_gray_u8(
+                self.rgb_image, device=device)
+        else:
             raise ValueError(
                 f"Invalid shape {im_shape} must be (N, M, 3) "
                 f"or (N, M, 4) or (N, M)")
-        if not self._orig_gray:
-            self.gray_image: np.ndarray = rgb2gray(self.rgb_image)
+
+    @property
+    def gray_image_f32(self) -> np.ndarray:
+        r"""float32 copy of `gray_image` scaled to [0, 1]
+
+        `gray_image` stays uint8 for uint8 inputs (8x less bandwidth per
+        filter pass); consumers that genuinely need floating point
+        should read this instead.
+        """
+        if self.gray_image.dtype == np.uint8:
+            return self.gray_image.astype(np.float32) * np.float32(1 / 255)
+        return self.gray_image
 
     def _return_image(self, image: np.ndarray, return_flag: bool):
         return image if return_flag else None
 
     def _run_show(self):
-        if self.verbose:
-            plt.show()
+        if not self.verbose:
+            return  # no figures were created, nothing to show or close
+        # deferred: matplotlib is only needed for debugging plots
+        import matplotlib.pyplot as plt
+        plt.show()
         plt.close()
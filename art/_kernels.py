@@ -0,0 +1,47 @@
+# Optional JIT-compiled array kernels (numba)
+
+from typing import Optional
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+
+
+if _HAVE_NUMBA:
+    @njit(cache=True, parallel=True, fastmath=True)
+    def _gray_kernel(src, dst):  # pragma: no cover - compiled
+        # fixed-point Rec.601 luminance; coefficients sum to 256 so the
+        # shift is exact and no floating point is involved
+        for y in prange(src.shape[0]):
+            for x in range(src.shape[1]):
+                dst[y, x] = np.uint8(
+                    (np.uint32(77) * src[y, x, 0]
+                     + np.uint32(150) * src[y, x, 1]
+                     + np.uint32(29) * src[y, x, 2]) >> 8)
+
+
+def rgb_to_gray_u8(src: np.ndarray) -> Optional[np.ndarray]:
+    r"""uint8 RGB -> uint8 grayscale via a parallel fixed-point kernel
+
+    The multiply-add stays in registers and rows are split across cores
+    with `prange`, so large images convert at memory bandwidth.
+
+    Parameters
+    ----------
+    src : numpy.ndarray, shape=(N, M, 3), dtype=uint8
+
+    Returns
+    -------
+    gray_image : numpy.ndarray, shape=(N, M), dtype=uint8, optional
+        None when numba is not installed, so callers can fall through
+        to the NumPy path
+    """
+    if not _HAVE_NUMBA:
+        return None
+    dst = np.empty(src.shape[:2], dtype=np.uint8)
+    _gray_kernel(src, dst)
+    return dst
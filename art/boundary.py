@@ -1,11 +1,11 @@
 # pipeline: RGB image -> thresholding -> boundary image(s)
+from __future__ import annotations
+
 import time
 import warnings
-from typing import List, Literal, Optional, Tuple
+from typing import TYPE_CHECKING, List, Literal, Optional, Tuple
 
-import matplotlib.pyplot as plt
 import numpy as np
-from matplotlib.figure import Figure
 from scipy import ndimage, stats
 from skimage.color import gray2rgba
 from skimage.exposure import (adjust_gamma, adjust_log, adjust_sigmoid,
@@ -20,6 +20,30 @@ from skimage.transform import resize
 from ._base_image import BaseImage
 from .utils import display_image
 
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
+
+def _resize_mask(mask: np.ndarray, out_shape: Tuple[int, int]) -> np.ndarray:
+    r"""Resize a boolean mask to `out_shape` (rows, cols)
+
+    Dispatches to `cv2.resize` (SIMD bilinear on uint8) when available
+    and falls back to `skimage.transform.resize`. The mask is scaled to
+    0/255 before interpolating so any nonzero contribution survives
+    uint8 rounding, approximating the previous nonzero -> True behavior
+    (0/1 values would round everything below 0.5 away and thin boundary
+    lines could vanish on downscale).
+    """
+    out_shape = (int(out_shape[0]), int(out_shape[1]))
+    try:
+        import cv2
+        resized = cv2.resize(
+            mask.astype(np.uint8) * 255, (out_shape[1], out_shape[0]),
+            interpolation=cv2.INTER_LINEAR)
+        return resized > 0
+    except ImportError:
+        return resize(mask, out_shape, anti_aliasing=False).astype(bool)
+
 
 class BoundaryImage(BaseImage):
     r"""Generate boundary image by providing workhorse pipeline.
@@ -38,9 +62,13 @@ class BoundaryImage(BaseImage):
         (only usable if the image is a photograph; see Notes 1)
     photo_corr_method : {"gamma", "sigmoid", "log", "clahe", "histeq", "contrast_stretch"},
     default="sigmoid"
-        Method to apply contrast correction (see Notes 2)
+        Method to apply contrast correction (see Notes 2).
+        If None, skip correction entirely (even when `photo_correction=True`)
     verbose : bool, default=False
         Generate plots for each step
+    device : {"cpu", "gpu"}, default="cpu"
+        Run array kernels (grayscale conversion) on the GPU via cupy
+        when available; the skimage pipeline stages remain on CPU
     **kwargs
         Additional arguments for the relevant `photo_corr_method` skimage function
 
@@ -77,19 +105,22 @@ class BoundaryImage(BaseImage):
         self,
         rgb_image: np.ndarray,
         photo_correction: bool = False,
-        photo_corr_method: Literal["gamma", "sigmoid", "log",
-                                   "clahe", "histeq", "contrast_stretch"] = "sigmoid",
+        photo_corr_method: Optional[Literal[
+            "gamma", "sigmoid", "log",
+            "clahe", "histeq", "contrast_stretch"]] = "sigmoid",
         verbose: bool = False,
+        device: str = "cpu",
         **kwargs
     ):
         super().__init__(
             rgb_image=rgb_image,
             class_name="BoundaryImage",
-            verbose=verbose)
+            verbose=verbose,
+            device=device)
         self.photo_correction = photo_correction
         self.photo_corr_method = photo_corr_method
         self.photo_corr_gray_image: np.ndarray = self.gray_image.copy()
-        if self.photo_correction:
+        if self.photo_correction and photo_corr_method is not None:
             self.verbose = False
             self.photo_correct(
                 photo_corr_method=photo_corr_method,
@@ -154,6 +185,7 @@ class BoundaryImage(BaseImage):
         self.photo_corr_gray_image: np.ndarray = pc_gi
         fig: Figure = None
         if self.verbose:
+            import matplotlib.pyplot as plt
             fig, (ax0, ax1) = plt.subplots(ncols=2, figsize=(8, 5))
             display_image(self.gray_image, cmap="gray", ax=ax0)
             display_image(pc_gi, cmap="gray", ax=ax1)
@@ -191,10 +223,15 @@ class BoundaryImage(BaseImage):
             raise ValueError(f"n_classes ({n_classes}) must be >= 2")
         thresholds = threshold_multiotsu(
             self.photo_corr_gray_image, classes=n_classes)
+        # right=True keeps pixels equal to a threshold in the lower
+        # class: on uint8 two-tone images multiotsu returns the darker
+        # pixel value itself, and right=False would collapse both tones
+        # into a single class
         self.threshold_image: np.ndarray = np.digitize(
-            self.photo_corr_gray_image, bins=thresholds)
+            self.photo_corr_gray_image, bins=thresholds, right=True)
         fig: Figure = None
         if self.verbose:
+            import matplotlib.pyplot as plt
             fig, (ax0, ax1, ax2) = plt.subplots(ncols=3, figsize=(10, 5))
             display_image(self.rgb_image, cmap=self._orig_gray, ax=ax0)
             display_image(self.photo_corr_gray_image, cmap="gray", ax=ax1)
@@ -279,6 +316,7 @@ class BoundaryImage(BaseImage):
                 ~boundary_image, connectivity=2)
         fig: Figure = None
         if self.verbose:
+            import matplotlib.pyplot as plt
             fig, (ax0, ax1) = plt.subplots(ncols=2, figsize=(8, 6))
             display_image(self.rgb_image, cmap=self._orig_gray, ax=ax0)
             display_image(~boundary_image, cmap="gray", ax=ax1)
@@ -345,8 +383,7 @@ class BoundaryImage(BaseImage):
                 self.logger.info(
                     "NOTE: flipping target shape (swap width and height) due to scaling mismatch; "
                     f"new target shape: {conv_shape} (scaling factor = {nsc_fac:.2f})")
-            resized_bim: np.ndarray = resize(
-                boundary_image, conv_shape, anti_aliasing=False).astype(bool)
+            resized_bim: np.ndarray = _resize_mask(boundary_image, conv_shape)
             self.logger.info(
                 f"Resized image from {b_shape} to {resized_bim.shape}")
         processed_boundary_image = resized_bim.copy()
@@ -1,15 +1,97 @@
 # GUI (equivalent to argparse) using GooeyParser
 
 import os
-from typing import List, Tuple
+import queue
+import threading
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 import numpy as np
-from gooey import Gooey, GooeyParser
-from matplotlib.pyplot import imsave
-from skimage.io import imread
 
-from art.boundary import BoundaryImage
-from art.utils import init_logger
+from .boundary import BoundaryImage
+from .utils import init_logger
+
+if TYPE_CHECKING:
+    from gooey import GooeyParser
+
+
+def _imread(fname: str) -> np.ndarray:
+    r"""Decode an image file via cv2 when available, else skimage
+
+    OpenCV's libpng/libjpeg bindings decode PNG/JPG much faster than the
+    imageio dispatch behind `skimage.io`, which also drags matplotlib in
+    at import time; its import is deferred so the fallback cost is only
+    paid for formats cv2 cannot read. IMREAD_UNCHANGED preserves alpha
+    and high-bit-depth data (e.g. 16-bit PNG/TIFF decode as uint16,
+    which the grayscale kernel normalizes by the dtype max).
+    """
+    try:
+        import cv2
+        img = cv2.imread(fname, cv2.IMREAD_UNCHANGED)
+        if img is not None:
+            if img.ndim == 3 and img.shape[2] >= 3:
+                img[..., :3] = img[..., :3][..., ::-1]  # BGR(A) -> RGB(A)
+            return img
+    except ImportError:
+        pass
+    from skimage.io import imread
+    return imread(fname)
+
+
+def _queue_depth(files: List[str]) -> int:
+    r"""Bound pipeline queue depth by available memory
+
+    The bounded queues give backpressure, so resident memory stays at
+    ~2 x depth x image size no matter how many files are queued. With
+    psutil installed the depth scales with free RAM (the buffers are
+    kept under ~25% of it), otherwise a conservative 2 is used.
+    """
+    try:
+        import psutil
+    except ImportError:
+        return 2
+    try:
+        # rough decoded-size estimate: compressed size x 10 (PNG/JPG)
+        est_size = max(os.path.getsize(fname) for fname in files) * 10
+        available = psutil.virtual_memory().available
+        depth = int(available // (8 * max(est_size, 1)))
+    except OSError:
+        return 2
+    return max(2, min(8, depth))
+
+
+def _write_image(output_loc: str, image: np.ndarray, dpi: int = 96) -> None:
+    r"""Encode and write an output image
+
+    PNG/JPG go through `cv2.imwrite` when available, which encodes the
+    raw array directly instead of rasterizing through matplotlib's AGG
+    canvas; PNG uses the RLE strategy, which crushes binary boundary
+    images almost instantly. PDF output (and the no-cv2 case) falls
+    back to `matplotlib.pyplot.imsave`.
+    """
+    ext = output_loc.rsplit('.', 1)[-1].lower()
+    if ext in ("png", "jpg", "jpeg"):
+        try:
+            import cv2
+            out = image
+            if out.dtype == bool:
+                out = out.astype(np.uint8) * 255
+            elif out.dtype != np.uint8:
+                out = np.rint(np.clip(out, 0, 1) * 255).astype(np.uint8)
+            if out.ndim == 3 and out.shape[2] >= 3:
+                # cv2 expects BGR(A) channel order
+                out = out[..., [2, 1, 0, 3]] if out.shape[2] == 4 \
+                    else out[..., ::-1]
+            params = []
+            if ext == "png":
+                params = [cv2.IMWRITE_PNG_STRATEGY,
+                          cv2.IMWRITE_PNG_STRATEGY_RLE]
+            if cv2.imwrite(output_loc, out, params):
+                return None
+        except ImportError:
+            pass
+    from matplotlib.pyplot import imsave
+    imsave(output_loc, image, cmap="gray", dpi=dpi)
+    return None
 
 
 class GUI():
@@ -38,18 +120,6 @@ class GUI():
         self.logger = init_logger("OutlineExtractor")
         self.args = args
         self.parse_args()
-        self.load_image()
-        self.boundary_handlers = [
-            BoundaryImage(rgb_image,
-                          photo_correction=self.is_photo,
-                          photo_corr_method=self.exposure_algo)
-            for rgb_image in self.rgb_images
-        ]
-
-    def load_image(self):
-        r"""Load RGB(A) image"""
-        self.rgb_images: List[np.ndarray] = [
-            imread(fname) for fname in self.files]
 
     def parse_args(self) -> None:
         r"""Parse and save `args` contents"""
@@ -59,8 +129,11 @@ class GUI():
         self.output_dir: str = self.args.output_dir
         # image settings
         self.is_photo: bool = self.args.is_photo
-        self.exposure_algo: str = self.options_mapper.get(
-            self.args.exposure_algo, "Sigmoid")
+        # only resolve an exposure algorithm when it will be used;
+        # BoundaryImage treats None as "skip correction"
+        self.exposure_algo: Optional[str] = self.options_mapper.get(
+            self.args.exposure_algo, "Sigmoid") if self.is_photo else None
+        self.device: str = self.args.device.lower()
         # output settings
         self.n_classes: int = self.args.n_classes
         self.output_ftype: str = self.args.filetype
@@ -68,33 +141,115 @@ class GUI():
         self.invert: bool = self.args.invert
         self.apply_post: bool = self.args.post_filter
         self.resolution: int = self.args.resolution if self.args.resolution > 50 else 96
-        self.resize_settings: Tuple[int, int] = (
-            self.args.width * self.resolution,
-            self.args.height * self.resolution)
-        if self.args.width <= 0 or self.args.height <= 0:
-            self.resize_settings = None
+        # pre-coerce to integer pixel counts once; the resize backends
+        # consume these per file and cv2 rejects float dimensions
+        self.resize_settings: Optional[Tuple[int, int]] = None
+        if self.args.width > 0 and self.args.height > 0:
+            self.resize_settings = (
+                int(round(self.args.width * self.resolution)),
+                int(round(self.args.height * self.resolution)))
+
+    def _output_location(self, k: int) -> str:
+        r"""Build output path for the `k`-th input file"""
+        fname = os.path.basename(self.files[k].rsplit('.', 1)[0])
+        output_filename = f"{fname}_boundary_mclass_{self.n_classes}"
+        if self.resize_settings is not None:
+            output_filename += f"__resized"
+        return os.path.join(
+            self.output_dir, f"{output_filename}.{self.output_ftype.lower()}")
 
     def run(self):
-        for k, boundary_handler in enumerate(self.boundary_handlers):
-            self.logger.info(
-                f"Starting {os.path.basename(self.files[k])} ("
-                f"{k + 1} / {len(self.boundary_handlers)})")
-            boundary_image = boundary_handler.run_pipeline(
-                n_classes=self.n_classes,
-                apply_post_filter=self.apply_post,
-                resize_shape=self.resize_settings,
-                invert_colors=self.invert,
-                transparent_background=self.transp_bg)
-            fname = os.path.basename(self.files[k].rsplit('.', 1)[0])
-            output_filename = f"{fname}_boundary_mclass_{self.n_classes}"
-            if self.resize_settings is not None:
-                output_filename += f"__resized"
-            output_loc = os.path.join(
-                self.output_dir, f"{output_filename}.{self.output_ftype.lower()}")
-            imsave(output_loc, boundary_image,
-                   cmap="gray", dpi=self.resolution)
-            self.logger.info(
-                f"Boundary image saved to {output_loc} with dpi={self.resolution}")
+        r"""Process all files through a 3-stage thread pipeline
+
+        Stage A decodes files, stage B runs the CPU-bound boundary
+        pipeline, and stage C encodes/writes outputs, connected by
+        bounded queues so each stage overlaps its neighbors (encoding
+        file k proceeds while file k + 1 is processed). Decoding
+        on-demand in stage A instead of up front keeps only a few
+        images resident at once regardless of batch size. numpy kernels
+        and codec I/O release the GIL, so the stages run concurrently.
+        """
+        depth = _queue_depth(self.files)
+        feed_q: queue.Queue = queue.Queue(maxsize=depth)
+        write_q: queue.Queue = queue.Queue(maxsize=depth)
+        errors: List[BaseException] = []
+        device = self.device
+        if device == "gpu":
+            try:
+                import cupy  # noqa: F401
+            except ImportError:
+                self.logger.warning(
+                    "GPU requested but cupy is unavailable; using CPU")
+                device = "cpu"
+
+        def _feed():
+            try:
+                for k, fname in enumerate(self.files):
+                    feed_q.put((k, _imread(fname)))
+            except BaseException as exc:
+                errors.append(exc)
+            finally:
+                feed_q.put(None)
+
+        def _process():
+            try:
+                while True:
+                    item = feed_q.get()
+                    if item is None:
+                        break
+                    k, rgb_image = item
+                    self.logger.info(
+                        f"Starting {os.path.basename(self.files[k])} ("
+                        f"{k + 1} / {len(self.files)})")
+                    boundary_handler = BoundaryImage(
+                        rgb_image,
+                        photo_correction=self.is_photo,
+                        photo_corr_method=self.exposure_algo,
+                        device=device)
+                    boundary_image = boundary_handler.run_pipeline(
+                        n_classes=self.n_classes,
+                        apply_post_filter=self.apply_post,
+                        resize_shape=self.resize_settings,
+                        invert_colors=self.invert,
+                        transparent_background=self.transp_bg)
+                    write_q.put((self._output_location(k), boundary_image))
+            except BaseException as exc:
+                errors.append(exc)
+                while feed_q.get() is not None:  # unblock the feeder
+                    pass
+            finally:
+                write_q.put(None)
+
+        def _write():
+            try:
+                while True:
+                    item = write_q.get()
+                    if item is None:
+                        write_q.task_done()
+                        break
+                    output_loc, boundary_image = item
+                    _write_image(output_loc, boundary_image,
+                                 dpi=self.resolution)
+                    self.logger.info(
+                        f"Boundary image saved to {output_loc} "
+                        f"with dpi={self.resolution}")
+                    write_q.task_done()
+            except BaseException as exc:
+                errors.append(exc)
+                write_q.task_done()
+                while write_q.get() is not None:  # unblock the processor
+                    write_q.task_done()
+                write_q.task_done()
+
+        threads = [threading.Thread(target=stage, daemon=True)
+                   for stage in (_feed, _process, _write)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        write_q.join()  # barrier: every accepted write reached disk
+        if errors:
+            raise errors[0]
         return None
 
 
@@ -104,8 +259,9 @@ def _dir_present(x: str):
     return x
 
 
-def parser() -> GooeyParser:
+def parser() -> "GooeyParser":
     r"""GUI parser with inputs similar to ArgumentParser"""
+    from gooey import GooeyParser
     parser = GooeyParser()
     step1 = parser.add_argument_group("1. Select File(s) and Output Location")
     step1.add_argument("filename", help="Select image(s) to process", metavar="Files",
@@ -128,6 +284,13 @@ def parser() -> GooeyParser:
         choices=["Gamma", "Sigmoid", "Log",
                  "CLAHE",
                  "Histogram Equalization", "Contrast Stretching"])
+    im_settings.add_argument(
+        "--device", metavar="Compute device",
+        help="Run array kernels on the GPU (requires cupy; "
+             "falls back to CPU if unavailable)",
+        default="CPU",
+        widget="Dropdown",
+        choices=["CPU", "GPU"])
     out_settings = parser.add_argument_group(
         "3. Output Settings",
         "Specify output image settings (filetype, background transparency, "
@@ -170,13 +333,24 @@ def parser() -> GooeyParser:
     return parser
 
 
-@Gooey(
-    program_name="Outline Extraction",
-    program_description=("Pipeline for extracting image outlines "
-                         "from photos and other graphics"),
-    default_size=(700, 600)
-)
 def gooey_gui():
-    gui_manager = GUI(parser().parse_args())
-    gui_manager.run()
+    # deferred: importing gooey pulls in wxPython, which is only needed
+    # once the GUI actually launches
+    from gooey import Gooey
+
+    @Gooey(
+        program_name="Outline Extraction",
+        program_description=("Pipeline for extracting image outlines "
+                             "from photos and other graphics"),
+        default_size=(700, 600)
+    )
+    def _launch():
+        gui_manager = GUI(parser().parse_args())
+        gui_manager.run()
+
+    _launch()
     return None
+
+
+if __name__ == "__main__":
+    gooey_gui()
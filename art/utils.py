@@ -1,12 +1,19 @@
 # General utilities for logging, plots, etc
+# NOTE: matplotlib/seaborn are imported lazily inside the plotting
+# helpers -- they are debugging aids the GUI workflow never touches,
+# and importing them at module load adds hundreds of ms of cold-start
+from __future__ import annotations
+
 import logging
-from typing import Optional, Union
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, Tuple, Union
 
-import matplotlib.pyplot as plt
-import seaborn as sns
-from matplotlib.axes import Axes
 from numpy import ndarray
 
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+
 
 def configure_logging(
     level: int = logging.INFO,
@@ -33,13 +40,37 @@ def configure_logging(
         **kwargs)
 
 
+_logging_configured = False
+
+
+@lru_cache(maxsize=None)
 def init_logger(name: Optional[str] = None) -> logging.Logger:
-    r"""Initialize standard logger with provided name (default="root")"""
-    if not logging.getLogger().handlers:
-        configure_logging(format=r"%(name)s :: %(levelname)-4s :: %(message)s")
+    r"""Initialize standard logger with provided name (default="root")
+
+    Memoized: the root-handler scan runs once and repeated lookups for
+    the same name skip the logging manager entirely (this is called per
+    image in the multi-file pipeline).
+    """
+    global _logging_configured
+    if not _logging_configured:
+        if not logging.getLogger().handlers:
+            configure_logging(
+                format=r"%(name)s :: %(levelname)-4s :: %(message)s")
+        _logging_configured = True
     return logging.getLogger(name)
 
 
+@lru_cache(maxsize=1)
+def _get_default_ax() -> Tuple[Figure, Axes]:
+    r"""Lazily create and cache the default Figure/Axes pair
+
+    Creating/tearing down a Figure per call is expensive when
+    `display_image` runs in a loop; reuse one pair instead.
+    """
+    import matplotlib.pyplot as plt
+    return plt.subplots()
+
+
 def display_image(
     image: ndarray,
     cmap: Union[bool, str] = False,
@@ -56,21 +87,39 @@ def display_image(
     ax : matplotlib.axes.Axes, optional
         Axes object to plot on; if None, create new Axes object
     """
+    import matplotlib.pyplot as plt
+    import seaborn as sns
     draw = False
     if isinstance(cmap, bool) and cmap:
         cmap = "gray"
     elif not cmap:
         cmap = None
+    axim = None
     if ax is None:
         draw = True
-        _, ax = plt.subplots()
-    ax.imshow(image, cmap=cmap)
-    sns.despine(ax=ax, left=True, bottom=True)
-    ax.tick_params(
-        axis="both",
-        labelbottom=False,
-        labelleft=False)
-    ax.axis("off")
+        fig, ax = _get_default_ax()
+        if not plt.fignum_exists(fig.number):
+            # cached figure was closed; rebuild the pair
+            _get_default_ax.cache_clear()
+            fig, ax = _get_default_ax()
+        if ax.images and ax.images[-1].get_array().shape == image.shape:
+            axim = ax.images[-1]
+        else:
+            ax.cla()
+    if axim is not None:
+        # shape matches the cached artist: swap data in place, skipping
+        # artist construction and colormap LUT re-normalization setup
+        axim.set_data(image)
+        axim.set_cmap(cmap)
+        axim.autoscale()
+    else:
+        ax.imshow(image, cmap=cmap)
+        sns.despine(ax=ax, left=True, bottom=True)
+        ax.tick_params(
+            axis="both",
+            labelbottom=False,
+            labelleft=False)
+        ax.axis("off")
     if draw:
         plt.show()
     return None